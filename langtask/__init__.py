@@ -6,7 +6,10 @@ from .api import (
     run,
     set_global_config,
     get_global_config,
-    set_logs
+    set_logs,
+    warmup_schemas,
+    get_schema_cache_info,
+    clear_schema_cache
 )
 
 from .core.exceptions import (
@@ -37,6 +40,9 @@ __all__ = [
     'set_global_config',
     'get_global_config',
     'set_logs',
+    'warmup_schemas',
+    'get_schema_cache_info',
+    'clear_schema_cache',
     
     # Base Exceptions
     'LangTaskError',
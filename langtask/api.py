@@ -14,10 +14,13 @@ Public Functions:
     set_global_config: Set or update global configuration
     get_global_config: Get current global configuration
     set_logs: Configure logging settings and location
+    warmup_schemas: Preload schema files ahead of first use
+    get_schema_cache_info: Get schema cache usage statistics
+    clear_schema_cache: Drop all cached schema classes
 """
 
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
 
 from .core.config_loader import (
     get_global_config as _get_global_config,
@@ -37,7 +40,12 @@ from .core.prompt_registrar import (
     get_prompts_list,
     get_prompt_info
 )
-from .core.schema_loader import StructuredResponse
+from .core.schema_loader import (
+    StructuredResponse,
+    warmup_schemas as _warmup_schemas,
+    get_schema_cache_info as _get_schema_cache_info,
+    clear_schema_cache as _clear_schema_cache
+)
 
 logger = get_logger(__name__)
 
@@ -296,4 +304,49 @@ def set_logs(
             message=f"Failed to configure logging: {str(e)}",
             source="logging",
             config_key="configuration"
-        )
\ No newline at end of file
+        )
+
+
+def warmup_schemas(paths: Iterable[str | Path]) -> int:
+    """Preload schema files in parallel so first requests skip schema conversion.
+
+    Args:
+        paths: Schema file paths to load (e.g., output_schema.yaml files)
+
+    Returns:
+        int: Number of schema files loaded successfully
+
+    Notes:
+        - Call once during application startup, optionally from a background thread
+        - Files that fail to load are logged as warnings; the same error is
+          raised when the prompt is run
+
+    Example:
+        >>> from pathlib import Path
+        >>> loaded = warmup_schemas(Path("./prompts").rglob("*_schema.yaml"))
+    """
+    return _warmup_schemas(paths)
+
+
+def get_schema_cache_info() -> dict[str, int]:
+    """Get usage statistics for the loaded schema cache.
+
+    Returns:
+        Dict[str, int]: Cache counters with hits, misses, size and max_size
+
+    Example:
+        >>> info = get_schema_cache_info()
+        >>> print(f"{info['size']} of {info['max_size']} schemas cached")
+    """
+    return _get_schema_cache_info()
+
+
+def clear_schema_cache() -> None:
+    """Drop all cached schema classes and reset cache statistics.
+
+    Schemas are reloaded from disk on next use.
+
+    Example:
+        >>> clear_schema_cache()
+    """
+    _clear_schema_cache()
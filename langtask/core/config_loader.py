@@ -75,14 +75,15 @@ def set_global_config(
         )
         
     except ValidationError as e:
+        errors = e.errors()
         logger.error(
             "Configuration validation failed",
-            errors=e.errors()
+            errors=errors
         )
         raise SchemaValidationError(
-            message=f"Invalid config schema. Check provider, model, temperature (0-1), and max_tokens fields: {e.errors()[0]['msg']}",
+            message=f"Invalid config schema. Check provider, model, temperature (0-1), and max_tokens fields: {errors[0]['msg']}",
             schema_type="config",
-            constraints={"validation_errors": e.errors()}
+            constraints={"validation_errors": errors}
         )
         
     except (FileSystemError, SchemaValidationError):
@@ -181,18 +182,19 @@ def load_config(file_path: str | Path) -> PromptConfig:
         return config
         
     except ValidationError as e:
+        errors = e.errors()
         prompt_id = config_dict.get('id', 'unknown') if isinstance(config_dict, dict) else 'unknown'
         logger.error(
             "Configuration validation failed",
             prompt_id=prompt_id,
             file_path=str(path),
-            errors=e.errors()
+            errors=errors
         )
         raise SchemaValidationError(
-            message=f"Invalid config in {path.name}. Required fields: id, llm provider/model. Error: {e.errors()[0]['msg']}",
+            message=f"Invalid config in {path.name}. Required fields: id, llm provider/model. Error: {errors[0]['msg']}",
             schema_type="config",
             field=prompt_id,
-            constraints={"validation_errors": e.errors()}
+            constraints={"validation_errors": errors}
         )
         
     except (FileSystemError, SchemaValidationError):
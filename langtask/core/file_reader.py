@@ -20,6 +20,12 @@ from .logger import get_logger
 
 logger = get_logger(__name__)
 
+# Use libyaml's C parser when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
 
 # Maximum allowed file size (10MB) to prevent memory issues
 MAX_FILE_SIZE = 10 * 1024 * 1024
@@ -185,6 +191,7 @@ def read_yaml_file(
 
     Notes:
         - Files are read entirely into memory
+        - Uses libyaml's safe C loader when available, else PyYAML's SafeLoader
         - Large YAML files may have significant parsing overhead
         - Consider memory usage for both file content and parsed structure
 
@@ -213,7 +220,7 @@ def read_yaml_file(
     
     try:
         content = read_text_file(path, max_size, request_id)
-        yaml_content = yaml.safe_load(content) or {}
+        yaml_content = yaml.load(content, Loader=YamlLoader) or {}
         
         duration_ms = (time.time() - start_time) * 1000
         logger.debug(
@@ -7,6 +7,7 @@ Public Functions:
     initialize_provider: Initialize connection to first available LLM provider
 """
 
+import hashlib
 import os
 import time
 
@@ -24,6 +25,26 @@ from .logger import get_logger
 logger = get_logger(__name__)
 
 
+# Environment variables each provider client reads when it is created
+OPENAI_ENV_VARS = (
+    'OPENAI_API_KEY',
+    'OPENAI_API_BASE',
+    'OPENAI_BASE_URL',
+    'OPENAI_ORGANIZATION',
+    'OPENAI_ORG_ID',
+    'OPENAI_PROJECT_ID',
+    'OPENAI_PROXY',
+)
+ANTHROPIC_ENV_VARS = (
+    'ANTHROPIC_API_KEY',
+    'ANTHROPIC_API_URL',
+    'ANTHROPIC_BASE_URL',
+)
+
+# Initialized connections keyed by (provider, model, temperature, max_tokens, env digest)
+_connection_cache: dict[tuple, ChatOpenAI | ChatAnthropic] = {}
+
+
 def initialize_provider(
     llm_configs: list[LLMConfig],
     request_id: str | None = None
@@ -42,6 +63,12 @@ def initialize_provider(
         EnvironmentError: When required API keys are missing
         ProviderAuthenticationError: When all provider connections fail
 
+    Notes:
+        - Connections are reused across calls with identical settings and
+          provider environment (API key, base URL, organization, proxy), so
+          structured output bindings can be reused as well. Only a hash of
+          the environment values is kept
+
     Logs:
         INFO: Attempting provider connection with details
         INFO: Provider initialized with duration
@@ -148,8 +175,12 @@ def _connect_openai(
             required=True
         )
     
+    cache_key = ('openai', model_name, temperature, max_tokens, _env_digest(OPENAI_ENV_VARS))
+    if cache_key in _connection_cache:
+        return _connection_cache[cache_key]
+    
     try:
-        return ChatOpenAI(
+        connection = ChatOpenAI(
             temperature=temperature,
             model=model_name,
             max_tokens=max_tokens
@@ -167,6 +198,9 @@ def _connect_openai(
             provider="openai",
             auth_type="initialization"
         )
+    
+    _connection_cache[cache_key] = connection
+    return connection
 
 
 def _connect_anthropic(
@@ -183,8 +217,12 @@ def _connect_anthropic(
             required=True
         )
     
+    cache_key = ('anthropic', model_name, temperature, max_tokens, _env_digest(ANTHROPIC_ENV_VARS))
+    if cache_key in _connection_cache:
+        return _connection_cache[cache_key]
+    
     try:
-        return ChatAnthropic(
+        connection = ChatAnthropic(
             model=model_name,
             temperature=temperature,
             max_tokens=max_tokens
@@ -201,4 +239,13 @@ def _connect_anthropic(
             message=f"Anthropic initialization failed. Check model '{model_name}' availability and account access.",
             provider="anthropic",
             auth_type="initialization"
-        )
\ No newline at end of file
+        )
+    
+    _connection_cache[cache_key] = connection
+    return connection
+
+
+def _env_digest(names: tuple[str, ...]) -> str:
+    """Hash client environment settings so cache keys never hold raw secrets."""
+    values = '\0'.join(f"{name}={os.getenv(name, '')}" for name in names)
+    return hashlib.sha256(values.encode('utf-8')).hexdigest()
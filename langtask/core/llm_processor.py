@@ -33,6 +33,13 @@ from .schema_loader import StructuredResponse
 logger = get_logger(__name__)
 
 
+# Maximum number of provider/schema structured output bindings kept for reuse
+MAX_STRUCTURED_PROVIDERS = 256
+
+# Structured output bindings keyed by (provider id, schema class)
+_structured_provider_cache: dict[tuple[int, type], tuple[Any, Any]] = {}
+
+
 def process_llm_request(prompt_id: str, input_params: dict[str, Any] | None = None) -> str | StructuredResponse:
     """Process an LLM request with complete lifecycle handling.
 
@@ -163,7 +170,7 @@ def _process_llm_call(
         # Configure provider for structured output if needed
         if output_schema:
             try:
-                provider = provider.with_structured_output(output_schema)
+                provider = _get_structured_provider(provider, output_schema)
             except Exception as e:
                 logger.error(
                     "Failed to configure structured output",
@@ -179,6 +186,7 @@ def _process_llm_call(
         
         # Prepare request messages
         messages = prompt.format_prompt(**params)
+        chat_messages = messages.to_messages()
         
         # Log request initiation at INFO level
         logger.info(
@@ -188,17 +196,18 @@ def _process_llm_call(
             has_schema=bool(output_schema)
         )
         
-        # Log detailed message content at DEBUG level
-        logger.debug(
-            "Sending prompt to LLM",
-            request_id=request_id,
-            messages=messages.to_string(),
-            provider=provider_name
-        )
+        # Log detailed message content at DEBUG level, rendering it only if kept
+        if logger.is_enabled('DEBUG'):
+            logger.debug(
+                "Sending prompt to LLM",
+                request_id=request_id,
+                messages=messages.to_string(),
+                provider=provider_name
+            )
 
         # Process Request
         try:
-            response = provider.invoke(messages.to_messages())
+            response = provider.invoke(chat_messages)
         except Exception as e:
             logger.error(
                 "Provider request failed",
@@ -222,15 +231,16 @@ def _process_llm_call(
             if output_schema:
                 response = handle_structured_output(response, output_schema, request_id)
             else:
-                response = response.content if hasattr(response, 'content') else response
+                response = getattr(response, 'content', response)
 
-            logger.debug(
-                "LLM response received",
-                request_id=request_id,
-                duration_ms=_get_duration_ms(start_time),
-                response_type=type(response).__name__,
-                response=response
-            )
+            if logger.is_enabled('DEBUG'):
+                logger.debug(
+                    "LLM response received",
+                    request_id=request_id,
+                    duration_ms=_get_duration_ms(start_time),
+                    response_type=type(response).__name__,
+                    response=response
+                )
             
             return response
             
@@ -267,6 +277,21 @@ def _process_llm_call(
         )
 
 
+def _get_structured_provider(provider: Any, output_schema: Type[StructuredResponse]) -> Any:
+    """Bind provider to output schema, reusing earlier bindings for the same pair."""
+    cache_key = (id(provider), output_schema)
+    cached = _structured_provider_cache.get(cache_key)
+    # Entry keeps the provider alive and is only valid for that same object
+    if cached is not None and cached[0] is provider:
+        return cached[1]
+    
+    structured_provider = provider.with_structured_output(output_schema)
+    if len(_structured_provider_cache) >= MAX_STRUCTURED_PROVIDERS:
+        _structured_provider_cache.pop(next(iter(_structured_provider_cache)), None)
+    _structured_provider_cache[cache_key] = (provider, structured_provider)
+    return structured_provider
+
+
 def _get_duration_ms(start_time: float) -> float:
     """Calculate duration in milliseconds from start time."""
     return round((time.time() - start_time) * 1000, 2)
\ No newline at end of file
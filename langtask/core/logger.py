@@ -27,6 +27,15 @@ from .exceptions import (
 LogLevel = Literal['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']
 DEFAULT_REQUEST_ID = "----------"
 
+# Severity numbers for built-in loguru levels, resolved once for level checks
+_LEVEL_NUMBERS = {
+    name: logger.level(name).no
+    for name in ('TRACE', 'DEBUG', 'INFO', 'SUCCESS', 'WARNING', 'ERROR', 'CRITICAL')
+}
+
+# Lowest severity accepted by any configured handler; 0 accepts everything
+_min_level_no = 0
+
 
 def _normalize_request_id(request_id: Any) -> str:
     """Convert request_id to string format, using default if None."""
@@ -57,6 +66,27 @@ class LoggerWrapper:
         self._logger = logger_instance
         self._request_id = DEFAULT_REQUEST_ID
         
+    def is_enabled(self, level: str) -> bool:
+        """Check whether messages at a level reach any configured handler.
+
+        Lets callers skip building expensive log arguments, such as timings
+        or serialized payloads, when the message would be discarded.
+
+        Args:
+            level: Level name (e.g., 'DEBUG', 'INFO', 'SUCCESS')
+
+        Returns:
+            bool: True if a handler set up by configure_logging accepts the level
+
+        Notes:
+            - Only handlers configured through configure_logging are considered;
+              sinks added directly to loguru are not tracked
+        """
+        level_no = _LEVEL_NUMBERS.get(level)
+        if level_no is None:
+            level_no = self._logger.level(level).no
+        return level_no >= _min_level_no
+        
     def bind(self, **kwargs) -> 'LoggerWrapper':
         """Create new logger instance with bound context.
 
@@ -237,6 +267,8 @@ def _initialize_logging(
 
     All parameters should be pre-validated before calling this function.
     """
+    global _min_level_no
+    
     base_logger = LoggerWrapper(logger.bind(
         request_id=DEFAULT_REQUEST_ID,
         clean_name="logger",
@@ -259,6 +291,7 @@ def _initialize_logging(
                 colorize=True,
                 level=console_level
             )
+            _min_level_no = _LEVEL_NUMBERS[console_level]
         except Exception as e:
             raise ConfigurationError(
                 message="Failed to configure console logging",
@@ -305,6 +338,7 @@ def _initialize_logging(
                 retention=retention,
                 level=file_level
             )
+            _min_level_no = min(_min_level_no, _LEVEL_NUMBERS[file_level])
             
             base_logger.info(f"Logging initialized. Log file: {log_file}")
             
@@ -332,6 +366,7 @@ def _initialize_logging(
 try:
     configure_logging()
 except Exception as e:
+    _min_level_no = 0
     logger.add(sys.stderr, format="{message}")
     # Use raw logger for fallback error since wrapper might not be working
     logger.error("Logging initialization failed. Falling back to basic stderr logging.")
\ No newline at end of file
@@ -18,6 +18,62 @@ from .schema_loader import StructuredResponse
 logger = get_logger(__name__)
 
 
+# User-friendly messages for common validation error types
+_ERROR_TEMPLATES = {
+    'dict_type': (
+        "The LLM returned an invalid format at '{loc}'. "
+        "Expected a structured object but received: '{preview}'. "
+        "Update the prompt to ensure proper response structure."
+    ),
+    'missing': (
+        "Required field '{loc}' is missing from LLM output. "
+        "Update the prompt to ensure all required fields are included."
+    ),
+    'type_error': (
+        "Invalid type at '{loc}': Expected {expected}, "
+        "got {input_type}. Value: '{preview}'. "
+        "Ensure the prompt specifies the correct data types."
+    ),
+    'literal_error': (
+        "Invalid option at '{loc}'. Value '{preview}' is not one of the allowed options. "
+        "Update the prompt to specify valid choices."
+    ),
+    'list_type': (
+        "Invalid list value at '{loc}': {msg}. "
+        "Ensure the prompt specifies the correct list format."
+    ),
+    'greater_than': (
+        "Value too small at '{loc}': {msg}. "
+        "Update the prompt to specify valid value ranges."
+    ),
+    'less_than': (
+        "Value too large at '{loc}': {msg}. "
+        "Update the prompt to specify valid value ranges."
+    ),
+    'string_pattern_match': (
+        "Invalid format at '{loc}': {msg}. "
+        "Ensure the prompt specifies the required format."
+    ),
+    'string_too_short': (
+        "Value too short at '{loc}': {msg}. "
+        "Update the prompt to specify minimum length requirements."
+    ),
+    'string_too_long': (
+        "Value too long at '{loc}': {msg}. "
+        "Update the prompt to specify maximum length requirements."
+    )
+}
+
+_DEFAULT_ERROR_TEMPLATE = (
+    "Schema validation failed at '{loc}': {msg}. "
+    "The LLM response doesn't match the schema. Error type: {error_type}. "
+    "Received: '{preview}'. Review the schema and prompt instructions."
+)
+
+# Maximum characters of offending input shown in error messages
+PREVIEW_LENGTH = 100
+
+
 def handle_structured_output(
     response_data: Any,
     output_schema: Type[StructuredResponse],
@@ -29,6 +85,7 @@ def handle_structured_output(
     - Schema compliance checking
     - Type validation and conversion
     - Required field verification
+    - Recovery of JSON string responses that match the schema
     - Detailed error reporting
 
     Args:
@@ -47,6 +104,7 @@ def handle_structured_output(
             - Response format is invalid
 
     Logs:
+        DEBUG: Response parsed from JSON string
         ERROR: Validation failures with details
         ERROR: Processing errors with context
 
@@ -56,31 +114,45 @@ def handle_structured_output(
         >>> response = handle_structured_output(data, schema, "123")
         >>> print(response.sentiment)  # Access fields with dot notation
     """
+    # If response is already a valid StructuredResponse, return it
+    if type(response_data) is output_schema or isinstance(response_data, output_schema):
+        logger.debug(
+            "Response already validated",
+            request_id=request_id,
+            schema=output_schema.__name__
+        )
+        return response_data
+        
     try:
-        # If response is already a valid StructuredResponse, return it
-        if isinstance(response_data, output_schema):
-            logger.debug(
-                "Response already validated",
-                request_id=request_id,
-                schema=output_schema.__name__
-            )
-            return response_data
-            
         # If response is a dict, validate it
         if isinstance(response_data, dict):
             return validate_llm_output(response_data, output_schema, request_id)
             
         # Handle potential JSON string responses
         if isinstance(response_data, str) and response_data.strip().startswith('{'):
+            # Salvage JSON that already matches the schema before failing
+            try:
+                validated = output_schema.model_validate_json(response_data)
+            except ValidationError:
+                pass
+            else:
+                logger.debug(
+                    "Response parsed from JSON string",
+                    request_id=request_id,
+                    schema=output_schema.__name__
+                )
+                return validated
+            
+            input_preview = _preview(response_data)
             raise SchemaValidationError(
                 message=(
                     "The LLM returned a JSON string instead of structured data. "
-                    f"Received: '{response_data[:100]}...'. "
+                    f"Received: '{input_preview}'. "
                     "Update the prompt to return direct structured output."
                 ),
                 schema_type="output",
                 field=output_schema.__name__,
-                constraints={"input_preview": response_data[:100]}
+                constraints={"input_preview": input_preview}
             )
             
         # Handle other invalid response types
@@ -152,31 +224,28 @@ def validate_llm_output(
         >>> result = validate_llm_output(data, schema, "123")
         >>> print(result.sentiment)  # Access fields with dot notation
     """
+    if type(output_data) is output_schema or isinstance(output_data, StructuredResponse):
+        return output_data
+        
     try:
-        if isinstance(output_data, StructuredResponse):
-            return output_data
-            
-        validated = output_schema(**output_data)
+        validated = output_schema.model_validate(output_data)
         
         logger.debug(
             "Output validation successful",
             request_id=request_id,
             schema=output_schema.__name__,
-            field_count=len(validated.model_dump())
+            field_count=len(output_schema.model_fields)
         )
         
         return validated
         
     except ValidationError as e:
-        error_details = e.errors()[0] if e.errors() else {}
+        errors = e.errors()
+        error_details = errors[0] if errors else {}
         error_loc = ' -> '.join(str(x) for x in error_details.get('loc', []))
         error_type = error_details.get('type', 'unknown')
         input_value = error_details.get('input', '')
-        
-        if isinstance(input_value, str) and len(input_value) > 100:
-            input_preview = input_value[:100] + '...'
-        else:
-            input_preview = str(input_value)
+        input_preview = _preview(input_value)
         
         logger.error(
             "Output validation failed",
@@ -189,56 +258,15 @@ def validate_llm_output(
         )
 
         # Map common validation errors to user-friendly messages
-        error_messages = {
-            'dict_type': (
-                f"The LLM returned an invalid format at '{error_loc}'. "
-                f"Expected a structured object but received: '{input_preview}'. "
-                f"Update the prompt to ensure proper response structure."
-            ),
-            'missing': (
-                f"Required field '{error_loc}' is missing from LLM output. "
-                f"Update the prompt to ensure all required fields are included."
-            ),
-            'type_error': (
-                f"Invalid type at '{error_loc}': Expected {error_details.get('expected', 'unknown')}, "
-                f"got {type(input_value).__name__}. Value: '{input_preview}'. "
-                f"Ensure the prompt specifies the correct data types."
-            ),
-            'literal_error': (
-                f"Invalid option at '{error_loc}'. Value '{input_preview}' is not one of the allowed options. "
-                f"Update the prompt to specify valid choices."
-            ),
-            'list_type': (
-                f"Invalid list value at '{error_loc}': {error_details.get('msg')}. "
-                f"Ensure the prompt specifies the correct list format."
-            ),
-            'greater_than': (
-                f"Value too small at '{error_loc}': {error_details.get('msg')}. "
-                f"Update the prompt to specify valid value ranges."
-            ),
-            'less_than': (
-                f"Value too large at '{error_loc}': {error_details.get('msg')}. "
-                f"Update the prompt to specify valid value ranges."
-            ),
-            'string_pattern_match': (
-                f"Invalid format at '{error_loc}': {error_details.get('msg')}. "
-                f"Ensure the prompt specifies the required format."
-            ),
-            'string_too_short': (
-                f"Value too short at '{error_loc}': {error_details.get('msg')}. "
-                f"Update the prompt to specify minimum length requirements."
-            ),
-            'string_too_long': (
-                f"Value too long at '{error_loc}': {error_details.get('msg')}. "
-                f"Update the prompt to specify maximum length requirements."
-            )
-        }
-
-        message = error_messages.get(error_type, (
-            f"Schema validation failed at '{error_loc}': {error_details.get('msg', str(e))}. "
-            f"The LLM response doesn't match the schema. Error type: {error_type}. "
-            f"Received: '{input_preview}'. Review the schema and prompt instructions."
-        ))
+        template = _ERROR_TEMPLATES.get(error_type, _DEFAULT_ERROR_TEMPLATE)
+        message = template.format_map({
+            'loc': error_loc,
+            'preview': input_preview,
+            'msg': error_details.get('msg', str(e)),
+            'expected': error_details.get('expected', 'unknown'),
+            'input_type': type(input_value).__name__,
+            'error_type': error_type
+        })
         
         raise SchemaValidationError(
             message=message,
@@ -246,7 +274,13 @@ def validate_llm_output(
             field=error_loc or output_schema.__name__,
             constraints={
                 "error_type": error_type,
-                "validation_errors": e.errors(),
+                "validation_errors": errors,
                 "input_preview": input_preview
             }
-        )
\ No newline at end of file
+        )
+
+
+def _preview(value: Any, limit: int = PREVIEW_LENGTH) -> str:
+    """Shorten value to limit characters for error messages and logs."""
+    text = value if type(value) is str else str(value)
+    return text if len(text) <= limit else text[:limit] + '...'
@@ -9,12 +9,23 @@ List fields are supported with size constraints using the 'list' attribute.
 
 Public Functions:
     load_yaml_schema: Loads and converts YAML schema to Pydantic model
+    get_schema_cache_info: Reports loaded schema cache usage statistics
+    clear_schema_cache: Drops all cached schema classes
+    warmup_schemas: Preloads schema files in parallel ahead of first use
 """
 
+import hashlib
+import json
+import os
 import re
+import sys
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Literal, Type, get_args, get_origin
+from typing import Any, Iterable, Iterator, Literal, Type, get_args, get_origin
 
 from pydantic import BaseModel, Field, create_model, ValidationError
 
@@ -26,7 +37,11 @@ logger = get_logger(__name__)
 
 
 class StructuredResponse(BaseModel):
-    """Base class for all structured LLM responses."""
+    """Base class for all structured LLM responses.
+
+    Option fields are typed as Literal values rather than Enums, so fields hold
+    plain primitives and attribute access uses Pydantic's default path.
+    """
     
     model_config = {
         "frozen": True,  # Make instances immutable
@@ -36,67 +51,125 @@ class StructuredResponse(BaseModel):
     
     def __str__(self) -> str:
         """Create a readable string representation of the response."""
-        return self._format_value(self.model_dump(), indent_level=0, is_root=True)
+        return ''.join(self._iter_format(self.model_dump(), indent_level=0, is_root=True))
     
-    def _format_value(self, value: Any, indent_level: int, is_root: bool = False) -> str:
-        """Recursively format values with proper indentation."""
-        indent = "    " * indent_level
-        next_indent = "    " * (indent_level + 1)
-        
+    def _iter_format(self, value: Any, indent_level: int, is_root: bool = False) -> Iterator[str]:
+        """Yield string pieces of a value formatted with proper indentation."""
         if isinstance(value, dict):
             if not value:
-                return "{}"
-                
-            items = []
+                yield "{}"
+                return
+            
+            next_indent = _indent(indent_level + 1)
+            yield f"{self.__class__.__name__}(\n" if is_root else "{\n"
+            
+            separator = ""
             for k, v in value.items():
-                formatted_value = self._format_value(v, indent_level + 1)
-                items.append(f"{next_indent}{k}={formatted_value}")
+                yield f"{separator}{next_indent}{k}="
+                yield from self._iter_format(v, indent_level + 1)
+                separator = ",\n"
                 
-            dict_content = ',\n'.join(items)
-            if is_root:
-                class_name = self.__class__.__name__
-                return f"{class_name}(\n{dict_content}\n{indent})"
-            return f"{{\n{dict_content}\n{indent}}}"
+            yield f"\n{_indent(indent_level)}{')' if is_root else '}'}"
             
         elif isinstance(value, list):
             if not value:
-                return "[]"
-                
-            items = []
+                yield "[]"
+                return
+            
+            next_indent = _indent(indent_level + 1)
+            yield "[\n"
+            
+            separator = ""
             for item in value:
-                formatted_item = self._format_value(item, indent_level + 1)
-                items.append(f"{next_indent}{formatted_item}")
+                yield f"{separator}{next_indent}"
+                yield from self._iter_format(item, indent_level + 1)
+                separator = ",\n"
                 
-            return "[\n" + ',\n'.join(items) + f"\n{indent}]"
+            yield f"\n{_indent(indent_level)}]"
             
         elif isinstance(value, (str, int, float, bool)):
-            return repr(value)
+            yield repr(value)
             
-        return str(value)
+        else:
+            yield str(value)
     
     def __repr__(self) -> str:
         """Use the same format for repr as str for consistency."""
         return self.__str__()
 
 
+# Indentation strings for response formatting, indexed by nesting level
+_INDENTS = tuple("    " * level for level in range(12))
+
+
+def _indent(level: int) -> str:
+    """Return the indentation string for a nesting level."""
+    return _INDENTS[level] if level < len(_INDENTS) else "    " * level
+
+
+# Shared generic alias for object fields so every schema reuses one instance
+_DICT_STR_ANY = dict[str, Any]
+
 # Standard type mappings for schema conversion
 TYPE_MAPPING = {
     'string': str,
     'integer': int,
     'number': float,
     'boolean': bool,
-    'object': dict[str, Any],  # Listed for validation - implementation uses nested Pydantic models
+    'object': _DICT_STR_ANY,  # Listed for validation - implementation uses nested Pydantic models
 }
 
+# Precomputed type names for error messages
+_TYPE_NAMES = tuple(TYPE_MAPPING)
+_TYPE_NAMES_JOINED = ', '.join(TYPE_MAPPING)
+
 # Types that support options lists
 OPTION_COMPATIBLE_TYPES = {'string', 'integer', 'number'}
 
+# Option-compatible type names in TYPE_MAPPING order for stable error messages
+_OPTION_TYPE_NAMES = tuple(t for t in TYPE_MAPPING if t in OPTION_COMPATIBLE_TYPES)
+_OPTION_TYPES_JOINED = ', '.join(_OPTION_TYPE_NAMES)
+
 # Maximum allowed nesting depth for object types
 MAX_NESTING_DEPTH = 4
 
+# Maximum number of nested object models kept for reuse across schemas
+NESTED_MODEL_CACHE_SIZE = 512
+
 # Regular expression for validating list specifications
 LIST_SPEC_PATTERN = re.compile(r'^(?:(\d+)-(\d+)|(\d+)\+)$')
 
+# Environment variable naming a directory for cached parsed schema files
+SCHEMA_CACHE_DIR_ENV = 'LANGTASK_SCHEMA_CACHE_DIR'
+
+# Version of the on-disk cache entry layout; bump to invalidate old entries
+SCHEMA_CACHE_FORMAT = 2
+
+# Maximum number of loaded schema classes kept in memory
+SCHEMA_CACHE_SIZE = 256
+
+# Maximum number of response classes kept for reuse across identical schemas
+RESPONSE_CLASS_CACHE_SIZE = 256
+
+# Nested object models keyed by (model name, depth, required default, properties signature)
+_nested_model_cache: dict[tuple[str, int, bool, str], Type[BaseModel]] = {}
+
+# Response classes keyed by (class name, schema signature)
+_response_class_cache: dict[tuple[str, str], Type[StructuredResponse]] = {}
+
+# Guards eviction and insertion in the response class and nested model caches
+_model_cache_lock = threading.Lock()
+
+# Loaded schema classes keyed by (resolved path, mtime, size), least recently used first
+_schema_cache: OrderedDict[tuple[str, int | None, int | None], Type[StructuredResponse] | None] = OrderedDict()
+_schema_cache_stats = {"hits": 0, "misses": 0}
+
+# Schema builds in progress, keyed like the schema cache, with a done event and result holder
+_schema_builds: dict[tuple[str, int | None, int | None], tuple[threading.Event, list]] = {}
+
+# Guards the schema cache, its statistics and the in-progress builds
+_schema_cache_lock = threading.Lock()
+
 
 def load_yaml_schema(file_path: str | Path, request_id: str | None = None) -> Type[StructuredResponse] | None:
     """Load and convert a YAML schema into a Pydantic response class.
@@ -133,6 +206,18 @@ def load_yaml_schema(file_path: str | Path, request_id: str | None = None) -> Ty
         - Maximum nesting depth is 4 levels
         - Field names are converted to lowercase internally
         - Options are only supported for string, integer, and number types
+        - Loaded classes are cached per resolved path and reloaded when the
+          file's modification time or size changes, keeping up to
+          SCHEMA_CACHE_SIZE most recently used schemas
+        - Files with the same name and identical content share one response
+          class, even across directories
+        - Safe to call from multiple threads; concurrent first loads of the
+          same file share a single build
+        - If LANGTASK_SCHEMA_CACHE_DIR is set, parsed schema files are also
+          cached there as JSON per path, modification time and size for reuse
+          across processes. The directory is created owner-only (0700), must
+          stay private to the application user, and is ignored if it is owned
+          by another user or writable by other users
 
     Example:
         >>> try:
@@ -149,48 +234,9 @@ def load_yaml_schema(file_path: str | Path, request_id: str | None = None) -> Ty
         ... except SchemaValidationError as e:
         ...     print(f"Schema error: {e.message}")
     """
-    start_time = time.time()
-    path = Path(file_path)
-    
     try:
-        logger.debug(
-            "Loading YAML schema",
-            file_path=str(path),
-            request_id=request_id
-        )
-        
-        yaml_schema = read_yaml_file(path, request_id=request_id)
-        if not yaml_schema:
-            logger.debug(
-                "No schema defined",
-                file_path=str(path),
-                request_id=request_id
-            )
-            return None
-        
-        # Validate overall schema structure
-        if not isinstance(yaml_schema, dict):
-            raise SchemaValidationError(
-                message=f"Schema must be a YAML dictionary. Found: {type(yaml_schema).__name__}",
-                schema_type="yaml",
-                field=path.stem,
-                constraints={"type": "object"}
-            )
-
-        # Validate and create model
-        _validate_schema(yaml_schema)
-        response_class = _create_pydantic_model(yaml_schema, path.stem)
-        
-        duration_ms = (time.time() - start_time) * 1000
-        logger.debug(
-            "Schema loaded and converted",
-            file_path=str(path),
-            duration_ms=round(duration_ms, 2),
-            field_count=len(yaml_schema),
-            request_id=request_id
-        )
-        
-        return response_class
+        # The cache key is built from the raw path so hits never construct a Path
+        return _load_schema_cached(*_get_cache_key(file_path), request_id)
         
     except FileSystemError:
         raise
@@ -199,22 +245,23 @@ def load_yaml_schema(file_path: str | Path, request_id: str | None = None) -> Ty
         raise
         
     except ValidationError as e:
+        errors = e.errors()
         logger.error(
             "Pydantic model creation failed",
-            file_path=str(path),
-            errors=e.errors(),
+            file_path=str(file_path),
+            errors=errors,
             request_id=request_id
         )
         raise SchemaValidationError(
-            message=f"Invalid schema definition. Check field types and constraints: {e.errors()[0]['msg']}",
+            message=f"Invalid schema definition. Check field types and constraints: {errors[0]['msg']}",
             schema_type="pydantic",
-            constraints={"validation_errors": e.errors()}
+            constraints={"validation_errors": errors}
         )
         
     except Exception as e:
         logger.error(
             "Unexpected error loading schema",
-            file_path=str(path),
+            file_path=str(file_path),
             error=str(e),
             error_type=type(e).__name__,
             request_id=request_id
@@ -222,330 +269,679 @@ def load_yaml_schema(file_path: str | Path, request_id: str | None = None) -> Ty
         raise SchemaValidationError(
             message=f"Failed to load schema. Verify file format and field definitions.",
             schema_type="unknown",
-            field=path.stem
+            field=Path(file_path).stem
+        )
+
+
+def get_schema_cache_info() -> dict[str, int]:
+    """Get usage statistics for the loaded schema class cache.
+
+    Returns:
+        Dictionary with cache counters:
+            - hits: Loads served from the cache
+            - misses: Loads that read and converted a schema file
+            - size: Number of schema classes currently cached
+            - max_size: Maximum number of cached schema classes
+
+    Example:
+        >>> info = get_schema_cache_info()
+        >>> hit_rate = info['hits'] / max(info['hits'] + info['misses'], 1)
+    """
+    with _schema_cache_lock:
+        return {
+            "hits": _schema_cache_stats["hits"],
+            "misses": _schema_cache_stats["misses"],
+            "size": len(_schema_cache),
+            "max_size": SCHEMA_CACHE_SIZE
+        }
+
+
+def clear_schema_cache() -> None:
+    """Drop all cached schema classes and reset cache statistics.
+
+    Schemas are reloaded from disk on next use.
+    """
+    with _schema_cache_lock:
+        _schema_cache.clear()
+        _schema_cache_stats["hits"] = 0
+        _schema_cache_stats["misses"] = 0
+    with _model_cache_lock:
+        _nested_model_cache.clear()
+        _response_class_cache.clear()
+
+
+def warmup_schemas(paths: Iterable[str | Path], request_id: str | None = None) -> int:
+    """Load schema files in parallel so first requests hit the schema cache.
+
+    Args:
+        paths: Schema file paths to preload
+        request_id: Optional identifier for tracing and logging purposes.
+
+    Returns:
+        int: Number of schema files loaded successfully
+
+    Logs:
+        WARNING: Schema files that failed to load, with error details
+        DEBUG: Warmup completion with duration and counts
+
+    Notes:
+        - Intended to be called once during application startup, e.g. from a
+          background thread, so no request pays the conversion cost
+        - Failures do not raise here; the same error is raised again when the
+          schema is loaded for a request
+        - Uses up to one worker thread per CPU
+
+    Example:
+        >>> loaded = warmup_schemas(Path("prompts").rglob("*_schema.yaml"))
+    """
+    start_time = time.time()
+    paths = list(paths)
+    if not paths:
+        return 0
+    
+    def _warm(path: str | Path) -> bool:
+        try:
+            load_yaml_schema(path, request_id)
+            return True
+        except (FileSystemError, SchemaValidationError) as e:
+            logger.warning(
+                "Schema warmup failed",
+                file_path=str(path),
+                error=str(e),
+                request_id=request_id
+            )
+            return False
+    
+    max_workers = min(len(paths), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        loaded = sum(executor.map(_warm, paths))
+    
+    logger.debug(
+        "Schema warmup complete",
+        duration_ms=round((time.time() - start_time) * 1000, 2),
+        loaded=loaded,
+        failed=len(paths) - loaded,
+        request_id=request_id
+    )
+    return loaded
+
+
+def _load_schema_cached(
+    resolved_path: str,
+    mtime_ns: int | None,
+    size: int | None,
+    request_id: str | None = None
+) -> Type[StructuredResponse] | None:
+    """Load schema class, cached per resolved path, modification time and size.
+
+    The build runs outside the cache so request_id reaches every log record
+    on a miss. Concurrent misses for the same key wait for the first
+    caller's build instead of converting the file again.
+    """
+    key = (resolved_path, mtime_ns, size)
+    with _schema_cache_lock:
+        if key in _schema_cache:
+            _schema_cache.move_to_end(key)
+            _schema_cache_stats["hits"] += 1
+            return _schema_cache[key]
+        _schema_cache_stats["misses"] += 1
+        build = _schema_builds.get(key)
+        is_builder = build is None
+        if is_builder:
+            build = _schema_builds[key] = (threading.Event(), [])
+    done, result = build
+    
+    if not is_builder:
+        done.wait()
+        if result:
+            return result[0]
+        # The first build failed; build again so this caller gets its own error
+        return _build_schema_class(resolved_path, mtime_ns, size, request_id)
+    
+    try:
+        result.append(_build_schema_class(resolved_path, mtime_ns, size, request_id))
+    finally:
+        with _schema_cache_lock:
+            del _schema_builds[key]
+            if result:
+                _schema_cache[key] = result[0]
+                if len(_schema_cache) > SCHEMA_CACHE_SIZE:
+                    _schema_cache.popitem(last=False)
+        done.set()
+    return result[0]
+
+
+def _build_schema_class(
+    resolved_path: str,
+    mtime_ns: int | None,
+    size: int | None,
+    request_id: str | None = None
+) -> Type[StructuredResponse] | None:
+    """Read and convert schema file into a response class."""
+    # Timing and debug records are skipped entirely when DEBUG is filtered out
+    debug_enabled = logger.is_enabled('DEBUG')
+    path = Path(resolved_path)
+    
+    if debug_enabled:
+        start_time = time.time()
+        logger.debug(
+            "Loading YAML schema",
+            file_path=resolved_path,
+            request_id=request_id
+        )
+    
+    yaml_schema = _read_schema_file(path, mtime_ns, size, request_id)
+    if not yaml_schema:
+        if debug_enabled:
+            logger.debug(
+                "No schema defined",
+                file_path=resolved_path,
+                request_id=request_id
+            )
+        return None
+    
+    # Validate overall schema structure
+    if not isinstance(yaml_schema, dict):
+        raise SchemaValidationError(
+            message=f"Schema must be a YAML dictionary. Found: {type(yaml_schema).__name__}",
+            schema_type="yaml",
+            field=path.stem,
+            constraints={"type": "object"}
+        )
+
+    # Validate and create model
+    response_class = _create_pydantic_model(yaml_schema, path.stem)
+    
+    if debug_enabled:
+        duration_ms = (time.time() - start_time) * 1000
+        logger.debug(
+            "Schema loaded and converted",
+            file_path=resolved_path,
+            duration_ms=round(duration_ms, 2),
+            field_count=len(yaml_schema),
+            request_id=request_id
+        )
+    
+    return response_class
+
+
+def _get_cache_key(path: str | Path) -> tuple[str, int | None, int | None]:
+    """Build schema cache key from resolved path, modification time and size."""
+    resolved_path = os.path.realpath(path)
+    try:
+        stat = os.stat(resolved_path)
+    except OSError:
+        return resolved_path, None, None
+    return resolved_path, stat.st_mtime_ns, stat.st_size
+
+
+def _read_schema_file(
+    path: Path,
+    mtime_ns: int | None,
+    size: int | None,
+    request_id: str | None = None
+) -> Any:
+    """Read YAML schema file, reusing parsed content from the disk cache if enabled."""
+    cache_dir = os.getenv(SCHEMA_CACHE_DIR_ENV)
+    if not cache_dir or mtime_ns is None:
+        # Without file stats, read_yaml_file reports any access problem
+        return read_yaml_file(path, request_id=request_id)
+    
+    cache_root = _private_cache_dir(cache_dir, request_id)
+    if cache_root is None:
+        return read_yaml_file(path, request_id=request_id)
+    
+    # Entries are stored per path as plain JSON and only reused while the file is unchanged
+    file_version = [SCHEMA_CACHE_FORMAT, mtime_ns, size]
+    path_hash = hashlib.sha256(str(path).encode('utf-8')).hexdigest()
+    cache_file = cache_root / f"{path_hash}.json"
+    try:
+        with cache_file.open('r', encoding='utf-8') as f:
+            entry = json.load(f)
+        if entry['version'] == file_version:
+            return entry['schema']
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.debug(
+            "Ignoring unreadable schema cache entry",
+            cache_file=str(cache_file),
+            error=str(e),
+            request_id=request_id
+        )
+    
+    yaml_schema = read_yaml_file(path, request_id=request_id)
+    # Schemas with values JSON cannot represent exactly, such as dates, are not cached
+    if not _is_plain_json(yaml_schema):
+        return yaml_schema
+    
+    try:
+        temp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        with temp_file.open('w', encoding='utf-8') as f:
+            json.dump({'version': file_version, 'schema': yaml_schema}, f)
+        os.replace(temp_file, cache_file)
+    except Exception as e:
+        logger.debug(
+            "Failed to write schema cache entry",
+            cache_file=str(cache_file),
+            error=str(e),
+            request_id=request_id
+        )
+    return yaml_schema
+
+
+def _private_cache_dir(cache_dir: str, request_id: str | None = None) -> Path | None:
+    """Create schema cache directory as owner-only, or None if it is unavailable or not private."""
+    cache_root = Path(cache_dir)
+    try:
+        cache_root.mkdir(mode=0o700, parents=True, exist_ok=True)
+        # Entries from a directory another user owns or can write to could redefine schemas
+        if os.name == 'posix':
+            stat = cache_root.stat()
+            if stat.st_uid != os.getuid() or stat.st_mode & 0o022:
+                logger.warning(
+                    "Schema cache directory is not private to the current user; disk cache disabled",
+                    cache_dir=cache_dir,
+                    request_id=request_id
+                )
+                return None
+    except OSError as e:
+        logger.debug(
+            "Schema cache directory unavailable",
+            cache_dir=cache_dir,
+            error=str(e),
+            request_id=request_id
         )
+        return None
+    return cache_root
 
 
-def _validate_schema(schema: dict[str, Any], field_path: str = "", depth: int = 0) -> None:
-    """Validate schema structure and field definitions recursively."""
-    for field_name, field_def in schema.items():
-        current_path = f"{field_path}.{field_name}" if field_path else field_name
+def _create_pydantic_model(schema: dict[str, Any], schema_name: str) -> Type[StructuredResponse]:
+    """Validate schema and create Pydantic response class, reusing classes for identical schemas."""
+    class_name = _class_name_for(schema_name)
+    signature = _schema_signature(schema)
+    cache_key = (class_name, signature)
+    if signature is not None:
+        cached_class = _response_class_cache.get(cache_key)
+        if cached_class is not None:
+            return cached_class
+    
+    fields = _build_fields(schema)
+    response_class = create_model(
+        class_name,
+        __base__=StructuredResponse,
+        **fields
+    )
+    
+    if signature is not None:
+        with _model_cache_lock:
+            if len(_response_class_cache) >= RESPONSE_CLASS_CACHE_SIZE:
+                _response_class_cache.pop(next(iter(_response_class_cache)), None)
+            _response_class_cache[cache_key] = response_class
+    return response_class
+
+
+@lru_cache(maxsize=256)
+def _class_name_for(stem: str) -> str:
+    """Build meaningful response class name from schema file stem."""
+    return f"{stem.title().replace('_', '')}Response"
+
+
+def _build_fields(
+    schema: dict[str, Any],
+    parent_path: str = "",
+    depth: int = 0,
+    required_default: bool = True
+) -> dict[str, tuple[Any, Any]]:
+    """Validate field definitions and map interned lowercase names to Pydantic field tuples."""
+    # Interned names let matching output keys compare by identity
+    return {
+        sys.intern(field_name.lower()): _convert_to_pydantic_field(
+            field_def,
+            f"{parent_path}.{field_name}" if parent_path else field_name,
+            depth,
+            required_default
+        )
+        for field_name, field_def in schema.items()
+    }
+
+
+def _convert_to_pydantic_field(
+    field_def: Any,
+    current_path: str,
+    depth: int = 0,
+    required_default: bool = True
+) -> tuple[Any, Any]:
+    """Validate schema field definition and convert it to Pydantic field tuple."""
+    # Validate field definition structure
+    if not isinstance(field_def, dict):
+        raise SchemaValidationError(
+            message=f"Field '{current_path}' must be a dictionary defining type and constraints.",
+            schema_type="field",
+            field=current_path,
+            constraints={"expected_type": "object"}
+        )
         
-        # Validate field definition structure
-        if not isinstance(field_def, dict):
+    # Validate required type field
+    if 'type' not in field_def:
+        raise SchemaValidationError(
+            message=f"Field '{current_path}' missing 'type'. Specify one of: {_TYPE_NAMES_JOINED}",
+            schema_type="field",
+            field=current_path,
+            constraints={"required_attribute": "type"}
+        )
+        
+    # Validate type value; the lookup result is reused for options and the type hint
+    field_type = field_def['type']
+    try:
+        python_type = TYPE_MAPPING[field_type]
+    except (KeyError, TypeError):
+        raise SchemaValidationError(
+            message=f"Field '{current_path}' has invalid type: {field_type}",
+            schema_type="type",
+            field=current_path,
+            constraints={
+                "invalid_type": field_type,
+                "allowed_types": _TYPE_NAMES
+            }
+        )
+        
+    # Validate nested object structure
+    if field_type == 'object':
+        if depth >= MAX_NESTING_DEPTH:
             raise SchemaValidationError(
-                message=f"Field '{current_path}' must be a dictionary defining type and constraints.",
-                schema_type="field",
+                message=f"Field '{current_path}' exceeds maximum nesting depth of {MAX_NESTING_DEPTH}",
+                schema_type="nesting",
                 field=current_path,
-                constraints={"expected_type": "object"}
+                constraints={"max_depth": MAX_NESTING_DEPTH}
             )
-            
-        # Validate required type field
-        if 'type' not in field_def:
+        
+        if 'properties' not in field_def:
             raise SchemaValidationError(
-                message=f"Field '{current_path}' missing 'type'. Specify one of: {', '.join(TYPE_MAPPING.keys())}",
-                schema_type="field",
+                message=f"Object field '{current_path}' must define 'properties'",
+                schema_type="object",
                 field=current_path,
-                constraints={"required_attribute": "type"}
+                constraints={"required_attribute": "properties"}
             )
             
-        # Validate type value
-        field_type = field_def.get('type')
-        if field_type not in TYPE_MAPPING:
+        if not isinstance(field_def['properties'], dict):
             raise SchemaValidationError(
-                message=f"Field '{current_path}' has invalid type: {field_type}",
-                schema_type="type",
+                message=f"Object field '{current_path}' properties must be a mapping of field definitions",
+                schema_type="object",
                 field=current_path,
-                constraints={
-                    "invalid_type": field_type,
-                    "allowed_types": list(TYPE_MAPPING.keys())
-                }
+                constraints={"type": "object"}
             )
             
-        # Validate list specification if present
-        if 'list' in field_def:
-            try:
-                _parse_list_spec(field_def['list'])
-            except SchemaValidationError as e:
-                raise SchemaValidationError(
-                    message=f"Invalid list specification for field '{current_path}': {e.message}",
-                    schema_type="list",
-                    field=current_path,
-                    constraints=e.constraints
-                )
-        
-        # Handle nested object validation
-        if field_type == 'object':
-            if depth >= MAX_NESTING_DEPTH:
-                raise SchemaValidationError(
-                    message=f"Field '{current_path}' exceeds maximum nesting depth of {MAX_NESTING_DEPTH}",
-                    schema_type="nesting",
-                    field=current_path,
-                    constraints={"max_depth": MAX_NESTING_DEPTH}
-                )
-                
-            if 'properties' not in field_def:
-                raise SchemaValidationError(
-                    message=f"Object field '{current_path}' must define 'properties'",
-                    schema_type="object",
-                    field=current_path,
-                    constraints={"required_attribute": "properties"}
-                )
-                
-            _validate_schema(field_def['properties'], current_path, depth + 1)
-            
-        # Validate options if present
-        if 'options' in field_def:
-            # First validate that the field type supports options
-            if field_type not in OPTION_COMPATIBLE_TYPES:
-                raise SchemaValidationError(
-                    message=f"Field '{current_path}' has type '{field_type}' which does not support options. Options are only "
-                           f"supported for: {', '.join(OPTION_COMPATIBLE_TYPES)}",
-                    schema_type="options",
-                    field=current_path,
-                    constraints={"allowed_types": list(OPTION_COMPATIBLE_TYPES)}
-                )
-            
-            # Then validate the options list structure
-            option_values = field_def['options']
-            if not isinstance(option_values, list) or not option_values:
+    # Validate options if present
+    if 'options' in field_def:
+        _validate_options(field_def['options'], field_type, python_type, current_path)
+    
+    get = field_def.get
+    
+    # Nested properties inherit optional status from their parent
+    is_required = get('required', required_default)
+    field_type_hint = _get_field_type(field_def, field_type, python_type, current_path, depth, is_required)
+    
+    # Fields are required by default in Pydantic
+    # Only set default if field is optional or has explicit default
+    field_kwargs = {
+        "description": get('description', ''),
+        "title": get('title')
+    }
+    
+    # Handle list constraints if present
+    if 'list' in field_def:
+        try:
+            min_items, max_items = _parse_list_spec(field_def['list'])
+        except SchemaValidationError as e:
+            raise SchemaValidationError(
+                message=f"Invalid list specification for field '{current_path}': {e}",
+                schema_type="list",
+                field=current_path,
+                constraints=e.constraints
+            )
+        if min_items is not None:
+            field_kwargs["min_length"] = min_items
+        if max_items is not None:
+            field_kwargs["max_length"] = max_items
+    
+    # Handle optional fields and defaults
+    if not is_required:
+        field_kwargs["default"] = get('default')
+    elif 'default' in field_def:
+        field_kwargs["default"] = field_def['default']
+
+    # Handle string constraints
+    if field_type == 'string':
+        has_min_characters = 'min_characters' in field_def
+        if has_min_characters:
+            min_characters = field_def['min_characters']
+            if not isinstance(min_characters, int) or min_characters < 0:
                 raise SchemaValidationError(
-                    message=f"Field '{current_path}' has invalid options definition. Must be a non-empty list.",
-                    schema_type="options",
+                    message=f"Field '{current_path}' min_characters must be a positive integer",
+                    schema_type="field",
                     field=current_path,
-                    constraints={"requirement": "non-empty list of values"}
+                    constraints={"min_characters": min_characters}
                 )
+            field_kwargs["min_length"] = min_characters
             
-            # Validate option value types match the field type
-            expected_type = TYPE_MAPPING[field_type]
-            if not all(isinstance(v, expected_type) for v in option_values):
+        if 'max_characters' in field_def:
+            max_characters = field_def['max_characters']
+            if not isinstance(max_characters, int) or max_characters < 1:
                 raise SchemaValidationError(
-                    message=f"Field '{current_path}' options must all be of type {field_type}",
-                    schema_type="options",
+                    message=f"Field '{current_path}' max_characters must be a positive integer",
+                    schema_type="field",
                     field=current_path,
-                    constraints={"expected_type": field_type}
+                    constraints={"max_characters": max_characters}
                 )
-
-
-def _create_pydantic_model(schema: dict[str, Any], schema_name: str) -> Type[StructuredResponse]:
-    """Create Pydantic response class from validated schema dictionary."""
-    try:
-        fields = {}
-        for field_name, field_def in schema.items():
-            # Convert field names to lowercase
-            field_type, field_info = _convert_to_pydantic_field(field_name.lower(), field_def)
-            fields[field_name.lower()] = (field_type, field_info)
-
-        # Create class with meaningful name
-        class_name = f"{schema_name.title().replace('_', '')}Response"
-        return create_model(
-            class_name,
-            __base__=StructuredResponse,
-            **fields
-        )
-        
-    except Exception as e:
-        logger.error(
-            "Response class creation failed",
-            error=str(e),
-            fields=list(schema.keys())
-        )
-        raise SchemaValidationError(
-            message="Failed to create response class",
-            schema_type="model",
-            constraints={"error": str(e)}
-        )
-
-
-def _convert_to_pydantic_field(
-    field_name: str,
-    field_def: dict[str, Any],
-    parent_path: str = ""
-) -> tuple[Any, Field]:
-    """Convert schema field definition to Pydantic field tuple."""
-    try:
-        field_type = _get_field_type(field_name, field_def, parent_path)
-        
-        # Fields are required by default in Pydantic
-        # Only set default if field is optional or has explicit default
-        field_kwargs = {
-            "description": field_def.get('description', ''),
-            "title": field_def.get('title')
-        }
-        
-        # Handle list constraints if present
-        if 'list' in field_def:
-            min_items, max_items = _parse_list_spec(field_def['list'])
-            if min_items is not None:
-                field_kwargs["min_length"] = min_items
-            if max_items is not None:
-                field_kwargs["max_length"] = max_items
-        
-        # Handle optional fields and defaults
-        if not field_def.get('required', True):
-            field_kwargs["default"] = field_def.get('default', None)
-        elif 'default' in field_def:
-            field_kwargs["default"] = field_def['default']
-
-        # Handle string constraints
-        if field_def.get('type') == 'string':
-            if 'min_characters' in field_def:
-                if not isinstance(field_def['min_characters'], int) or field_def['min_characters'] < 0:
-                    raise SchemaValidationError(
-                        message=f"Field '{current_path}' min_characters must be a positive integer",
-                        schema_type="field",
-                        field=current_path,
-                        constraints={"min_characters": field_def['min_characters']}
-                    )
-                field_kwargs["min_length"] = field_def['min_characters']
-                
-            if 'max_characters' in field_def:
-                if not isinstance(field_def['max_characters'], int) or field_def['max_characters'] < 1:
-                    raise SchemaValidationError(
-                        message=f"Field '{current_path}' max_characters must be a positive integer",
-                        schema_type="field",
-                        field=current_path,
-                        constraints={"max_characters": field_def['max_characters']}
-                    )
-                field_kwargs["max_length"] = field_def['max_characters']
-                
-            if 'min_characters' in field_def and 'max_characters' in field_def:
-                if field_def['min_characters'] > field_def['max_characters']:
-                    raise SchemaValidationError(
-                        message=f"Field '{current_path}' min_characters cannot be greater than max_characters",
-                        schema_type="field",
-                        field=current_path,
-                        constraints={
-                            "min_characters": field_def['min_characters'],
-                            "max_characters": field_def['max_characters']
-                        }
-                    )
-                    
-            if 'pattern' in field_def:
-                try:
-                    re.compile(field_def['pattern'])
-                    field_kwargs["pattern"] = field_def['pattern']
-                except re.error as e:
-                    raise SchemaValidationError(
-                        message=f"Field '{current_path}' has invalid regex pattern: {str(e)}",
-                        schema_type="field",
-                        field=current_path,
-                        constraints={"pattern": field_def['pattern']}
-                    )
+            field_kwargs["max_length"] = max_characters
             
-        # Handle numeric constraints
-        if field_def.get('type') in ('integer', 'number'):
-            # Check for contradictory constraints
-            if 'min' in field_def and 'exclusive_min' in field_def:
+            if has_min_characters and min_characters > max_characters:
                 raise SchemaValidationError(
-                    message=f"Field '{current_path}' cannot have both 'min' and 'exclusive_min' constraints",
+                    message=f"Field '{current_path}' min_characters cannot be greater than max_characters",
                     schema_type="field",
                     field=current_path,
-                    constraints={"conflicting_rules": ["min", "exclusive_min"]}
+                    constraints={
+                        "min_characters": min_characters,
+                        "max_characters": max_characters
+                    }
                 )
-            
-            if 'max' in field_def and 'exclusive_max' in field_def:
+                
+        if 'pattern' in field_def:
+            pattern = field_def['pattern']
+            try:
+                re.compile(pattern)
+                field_kwargs["pattern"] = pattern
+            except (re.error, TypeError) as e:
                 raise SchemaValidationError(
-                    message=f"Field '{current_path}' cannot have both 'max' and 'exclusive_max' constraints",
+                    message=f"Field '{current_path}' has invalid regex pattern: {str(e)}",
                     schema_type="field",
                     field=current_path,
-                    constraints={"conflicting_rules": ["max", "exclusive_max"]}
+                    constraints={"pattern": pattern}
                 )
+        
+    # Handle numeric constraints
+    if field_type in ('integer', 'number'):
+        # Check for contradictory constraints
+        if 'min' in field_def and 'exclusive_min' in field_def:
+            raise SchemaValidationError(
+                message=f"Field '{current_path}' cannot have both 'min' and 'exclusive_min' constraints",
+                schema_type="field",
+                field=current_path,
+                constraints={"conflicting_rules": ["min", "exclusive_min"]}
+            )
+        
+        if 'max' in field_def and 'exclusive_max' in field_def:
+            raise SchemaValidationError(
+                message=f"Field '{current_path}' cannot have both 'max' and 'exclusive_max' constraints",
+                schema_type="field",
+                field=current_path,
+                constraints={"conflicting_rules": ["max", "exclusive_max"]}
+            )
 
-            # Handle inclusive bounds
-            if 'min' in field_def:
-                field_kwargs["ge"] = field_def['min']
-            if 'max' in field_def:
-                field_kwargs["le"] = field_def['max']
-            
-            # Handle exclusive bounds
-            if 'exclusive_min' in field_def:
-                field_kwargs["gt"] = field_def['exclusive_min']
-            if 'exclusive_max' in field_def:
-                field_kwargs["lt"] = field_def['exclusive_max']
-            
-            if 'multiple_of' in field_def:
-                field_kwargs["multiple_of"] = field_def['multiple_of']
+        # Handle inclusive bounds
+        if 'min' in field_def:
+            field_kwargs["ge"] = field_def['min']
+        if 'max' in field_def:
+            field_kwargs["le"] = field_def['max']
         
-        return field_type, Field(**field_kwargs)
+        # Handle exclusive bounds
+        if 'exclusive_min' in field_def:
+            field_kwargs["gt"] = field_def['exclusive_min']
+        if 'exclusive_max' in field_def:
+            field_kwargs["lt"] = field_def['exclusive_max']
         
-    except Exception as e:
-        current_path = f"{parent_path}.{field_name}" if parent_path else field_name
+        if 'multiple_of' in field_def:
+            field_kwargs["multiple_of"] = field_def['multiple_of']
+    
+    return field_type_hint, Field(**field_kwargs)
+
+
+def _validate_options(option_values: Any, field_type: str, python_type: Any, current_path: str) -> None:
+    """Validate options list against the field type."""
+    # First validate that the field type supports options
+    if field_type not in OPTION_COMPATIBLE_TYPES:
         raise SchemaValidationError(
-            message=f"Failed to convert field '{current_path}': {str(e)}",
-            schema_type="field",
+            message=f"Field '{current_path}' has type '{field_type}' which does not support options. Options are only "
+                   f"supported for: {_OPTION_TYPES_JOINED}",
+            schema_type="options",
+            field=current_path,
+            constraints={"allowed_types": list(_OPTION_TYPE_NAMES)}
+        )
+    
+    # Then validate the options list structure
+    if not isinstance(option_values, list) or not option_values:
+        raise SchemaValidationError(
+            message=f"Field '{current_path}' has invalid options definition. Must be a non-empty list.",
+            schema_type="options",
+            field=current_path,
+            constraints={"requirement": "non-empty list of values"}
+        )
+    
+    # Validate option value types match the field type
+    # Exact type set check runs in C; isinstance fallback keeps subclass support
+    if (
+        not set(map(type, option_values)) <= {python_type}
+        and not all(isinstance(v, python_type) for v in option_values)
+    ):
+        raise SchemaValidationError(
+            message=f"Field '{current_path}' options must all be of type {field_type}",
+            schema_type="options",
             field=current_path,
-            constraints={"definition": field_def}
+            constraints={"expected_type": field_type}
         )
 
 
-def _get_field_type(field_name: str, field_def: dict[str, Any], parent_path: str = "") -> Any:
+def _get_field_type(
+    field_def: dict[str, Any],
+    field_type: str,
+    python_type: Any,
+    current_path: str,
+    depth: int,
+    is_required: bool
+) -> Any:
     """Determine Python type for schema field, including literals and nested objects."""
-    current_path = f"{parent_path}.{field_name}" if parent_path else field_name
     base_type = None
     
-    # Get parent's required status - defaults to True if not specified
-    is_required = field_def.get('required', True)
-    
     # Handle fields with options using Literal types
+    # Option values are already checked as str, int or float, so they are hashable
     if 'options' in field_def:
-        try:
-            option_values = tuple(field_def['options'])  # Convert to tuple for Literal
-            base_type = Literal[option_values]  # type: ignore
-        except Exception as e:
-            raise SchemaValidationError(
-                message=f"Invalid options for '{current_path}'. Values must be hashable.",
-                schema_type="options",
-                field=current_path,
-                constraints={"values": field_def['options']}
-            )
-    
-    schema_type = field_def.get('type')
+        # typing caches Literal types by value and type, keeping 1 and 1.0 apart
+        base_type = Literal[tuple(field_def['options'])]  # type: ignore
     
     # Handle nested objects
-    if schema_type == 'object' and 'properties' in field_def:
-        # Create nested fields
-        nested_fields = {}
-        for prop_name, prop_def in field_def['properties'].items():
-            # If parent is optional, property inherits this unless explicitly overridden
-            if not is_required:
-                prop_def = prop_def.copy()  # Create copy to avoid modifying original
-                prop_def.setdefault('required', False)
-                
-            nested_type, nested_info = _convert_to_pydantic_field(
-                prop_name.lower(),
-                prop_def,
-                current_path
-            )
-            nested_fields[prop_name.lower()] = (nested_type, nested_info)
-            
-        # Create nested model with descriptive name and proper inheritance
-        model_name = f"{current_path.title().replace('.', '_')}Model"
-        base_type = create_model(
-            model_name,
-            __base__=BaseModel,
-            **nested_fields,
-            __module__=StructuredResponse.__module__
-        )
+    if field_type == 'object':
+        base_type = _get_nested_model(field_def['properties'], current_path, depth, is_required)
     
     # Handle standard types if no options defined
-    if base_type is None and schema_type in TYPE_MAPPING:
-        base_type = TYPE_MAPPING[schema_type]
+    if base_type is None:
+        base_type = python_type
     
     # Wrap in list if specified
     if 'list' in field_def:
-        return list[base_type] if base_type is not None else list
+        return _list_type(base_type)
         
     # Make type optional if required=false
-    if not is_required and base_type is not None:
-        if get_origin(base_type) is not None and get_origin(base_type) is Literal:
+    if not is_required:
+        if get_origin(base_type) is Literal:
             existing_args = get_args(base_type)
-            if type(None) not in existing_args:
+            if None not in existing_args:
                 base_type = Literal[existing_args + (None,)]  # type: ignore
         else:
             base_type = base_type | None
     
-    return base_type or Any  # Fallback to Any for unknown types
+    return base_type
+
+
+def _get_nested_model(
+    properties: dict[str, Any],
+    current_path: str,
+    depth: int,
+    is_required: bool
+) -> Type[BaseModel]:
+    """Create nested object model, reusing models built from identical properties."""
+    # Create nested model with descriptive name and proper inheritance
+    model_name = f"{current_path.title().replace('.', '_')}Model"
+    signature = _schema_signature(properties)
+    # Depth is part of the key: 'a_b' and 'a.b' share a model name, and the
+    # deeper one must still have its nesting limit checked
+    cache_key = (model_name, depth, is_required, signature)
+    if signature is not None:
+        cached_model = _nested_model_cache.get(cache_key)
+        if cached_model is not None:
+            return cached_model
+    
+    # Recursion is bounded by MAX_NESTING_DEPTH and children must exist before
+    # their parent model, so a call per level is kept over an explicit stack
+    # If parent is optional, properties inherit this unless explicitly overridden
+    nested_fields = _build_fields(
+        properties,
+        current_path,
+        depth + 1,
+        is_required
+    )
+    nested_model = create_model(
+        model_name,
+        __base__=BaseModel,
+        **nested_fields,
+        __module__=StructuredResponse.__module__
+    )
+    
+    if signature is not None:
+        with _model_cache_lock:
+            if len(_nested_model_cache) >= NESTED_MODEL_CACHE_SIZE:
+                _nested_model_cache.pop(next(iter(_nested_model_cache)), None)
+            _nested_model_cache[cache_key] = nested_model
+    return nested_model
+
+
+def _schema_signature(schema: Any) -> str | None:
+    """Build canonical string for schema content, or None if it holds non-JSON values."""
+    # JSON would stringify dates via default or coerce non-string keys, letting
+    # distinct schemas share a signature, so such schemas are never cached
+    if not _is_plain_json(schema):
+        return None
+    return json.dumps(schema, sort_keys=True)
+
+
+def _is_plain_json(value: Any) -> bool:
+    """Check that value only holds str-keyed dicts, lists and JSON scalars."""
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return True
+    if isinstance(value, list):
+        return all(_is_plain_json(item) for item in value)
+    if isinstance(value, dict):
+        return all(
+            isinstance(key, str) and _is_plain_json(item)
+            for key, item in value.items()
+        )
+    return False
+
+
+@lru_cache(maxsize=512)
+def _list_type(item_type: Any) -> Any:
+    """Build list type for an item type, shared across schemas."""
+    return list[item_type]
 
 
 def _parse_list_spec(value: Any) -> tuple[int | None, int | None]: